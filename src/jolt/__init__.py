@@ -1,8 +1,16 @@
 from .client import JoltClient
-from .config import JoltConfig, JoltConfigBuilder
+from .config import (
+    JoltConfig,
+    JoltConfigBuilder,
+    PRIORITY_CONTROL,
+    PRIORITY_HIGH,
+    PRIORITY_NORMAL,
+    PRIORITY_LOW,
+)
 from .handler import JoltMessageHandler
 from .request import JoltRequestBuilder
 from .response import JoltErrorResponse, JoltTopicMessage, JoltResponseParser
+from .scheduler import JoltSendMetrics, JoltSendScheduler, JoltTokenBucket
 from .exceptions import JoltException
 
 __version__ = "1.0.0"
@@ -15,5 +23,12 @@ __all__ = [
     "JoltErrorResponse",
     "JoltTopicMessage",
     "JoltResponseParser",
+    "JoltSendMetrics",
+    "JoltSendScheduler",
+    "JoltTokenBucket",
     "JoltException",
+    "PRIORITY_CONTROL",
+    "PRIORITY_HIGH",
+    "PRIORITY_NORMAL",
+    "PRIORITY_LOW",
 ]
\ No newline at end of file
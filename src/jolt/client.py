@@ -5,6 +5,7 @@ from .config import JoltConfig
 from .handler import JoltMessageHandler
 from .request import JoltRequestBuilder
 from .response import JoltResponseParser, JoltOkResponse, JoltErrorResponse, JoltTopicMessage
+from .scheduler import JoltSendScheduler, JoltSendMetrics
 from .exceptions import JoltException
 
 class JoltClient:
@@ -17,6 +18,9 @@ class JoltClient:
         self._running = False
         self._write_lock = threading.Lock()
         self._connected = False
+        self._scheduler: Optional[JoltSendScheduler] = None
+        self._disconnect_lock = threading.Lock()
+        self._disconnect_notified = False
     
     def connect(self):
         if self._connected:
@@ -29,6 +33,11 @@ class JoltClient:
             self._socket.settimeout(None)
             self._connected = True
             self._running = True
+            self._disconnect_notified = False
+            
+            if self._config.is_scheduling_enabled():
+                self._scheduler = JoltSendScheduler(self._config, self._write, self._on_write_failed)
+                self._scheduler.start()
             
             self._reader_thread = threading.Thread(target=self._read_loop, daemon=True)
             self._reader_thread.start()
@@ -51,7 +60,7 @@ class JoltClient:
     
     def publish(self, topic: str, data: str):
         request = JoltRequestBuilder.publish(topic, data)
-        self._send(request)
+        self._send(request, topic)
     
     def ping(self):
         request = JoltRequestBuilder.ping()
@@ -61,6 +70,10 @@ class JoltClient:
         self._running = False
         self._connected = False
         
+        if self._scheduler:
+            self._scheduler.flush(timeout=2.0)
+            self._scheduler.stop()
+        
         if self._socket:
             try:
                 self._socket.shutdown(socket.SHUT_RDWR)
@@ -72,24 +85,58 @@ class JoltClient:
                 pass
             self._socket = None
         
+        if self._scheduler:
+            self._scheduler.join(timeout=2.0)
+        
         if self._reader_thread and self._reader_thread.is_alive():
             self._reader_thread.join(timeout=2.0)
     
     def is_connected(self) -> bool:
         return self._connected
     
-    def _send(self, json_str: str):
+    def get_send_metrics(self) -> JoltSendMetrics:
+        if self._scheduler:
+            return self._scheduler.get_metrics()
+        return JoltSendMetrics()
+    
+    def _send(self, json_str: str, topic: Optional[str] = None):
         if not self._connected or not self._socket:
             raise JoltException("Not connected")
         
+        if self._scheduler:
+            self._scheduler.submit(json_str, topic)
+            return
+        
+        try:
+            self._write(json_str)
+        except JoltException:
+            self._connected = False
+            raise
+    
+    def _on_write_failed(self, cause: Exception):
+        self._connected = False
+        if self._running:
+            self._notify_disconnected(cause)
+    
+    def _notify_disconnected(self, cause: Optional[Exception]):
+        with self._disconnect_lock:
+            if self._disconnect_notified:
+                return
+            self._disconnect_notified = True
+        self._handler.on_disconnected(cause)
+    
+    def _write(self, json_str: str):
+        sock = self._socket
+        if sock is None:
+            raise JoltException("Not connected")
+        
         with self._write_lock:
             try:
                 message = json_str.encode('utf-8')
-                self._socket.sendall(message)
+                sock.sendall(message)
                 # Debug logging (optional)
                 # print(f"[SENT] {json_str.rstrip()}")
             except Exception as e:
-                self._connected = False
                 raise JoltException(f"Failed to send: {e}")
     
     def _read_loop(self):
@@ -119,13 +166,13 @@ class JoltClient:
                     continue
                 except Exception as e:
                     if self._running:
-                        self._handler.on_disconnected(e)
+                        self._notify_disconnected(e)
                     break
         
         finally:
             self._connected = False
             if self._running:
-                self._handler.on_disconnected(None)
+                self._notify_disconnected(None)
     
     def _handle_line(self, raw_line: str):
         try:
@@ -1,8 +1,30 @@
+from typing import List, Optional, Tuple
+from .exceptions import JoltException
+
+PRIORITY_CONTROL = 0
+PRIORITY_HIGH = 1
+PRIORITY_NORMAL = 2
+PRIORITY_LOW = 3
+
+DEFAULT_MAX_QUEUE_SIZE = 10000
+DEFAULT_TOPIC_CACHE_SIZE = 4096
+
+
 class JoltConfig:
     
-    def __init__(self, host: str = "127.0.0.1", port: int = 8080):
+    def __init__(self, host: str = "127.0.0.1", port: int = 8080,
+                 rate_limits: Optional[List[Tuple[str, float, int]]] = None,
+                 topic_priorities: Optional[List[Tuple[str, int]]] = None,
+                 scheduling: bool = False,
+                 max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+                 topic_cache_size: int = DEFAULT_TOPIC_CACHE_SIZE):
         self._host = host
         self._port = port
+        self._rate_limits = list(rate_limits or [])
+        self._topic_priorities = list(topic_priorities or [])
+        self._scheduling = scheduling
+        self._max_queue_size = max_queue_size
+        self._topic_cache_size = topic_cache_size
     
     def get_host(self) -> str:
         return self._host
@@ -10,6 +32,21 @@ class JoltConfig:
     def get_port(self) -> int:
         return self._port
     
+    def get_rate_limits(self) -> List[Tuple[str, float, int]]:
+        return list(self._rate_limits)
+    
+    def get_topic_priorities(self) -> List[Tuple[str, int]]:
+        return list(self._topic_priorities)
+    
+    def get_max_queue_size(self) -> int:
+        return self._max_queue_size
+    
+    def get_topic_cache_size(self) -> int:
+        return self._topic_cache_size
+    
+    def is_scheduling_enabled(self) -> bool:
+        return self._scheduling or bool(self._rate_limits) or bool(self._topic_priorities)
+    
     @staticmethod
     def new_builder():
         return JoltConfigBuilder()
@@ -26,6 +63,11 @@ class JoltConfigBuilder:
     def __init__(self):
         self._host = "127.0.0.1"
         self._port = 8080
+        self._rate_limits: List[Tuple[str, float, int]] = []
+        self._topic_priorities: List[Tuple[str, int]] = []
+        self._scheduling = False
+        self._max_queue_size = DEFAULT_MAX_QUEUE_SIZE
+        self._topic_cache_size = DEFAULT_TOPIC_CACHE_SIZE
     
     def host(self, host: str):
         self._host = host
@@ -35,5 +77,45 @@ class JoltConfigBuilder:
         self._port = port
         return self
     
+    def rate_limit(self, pattern: str, rate: float, burst: int = 1):
+        """Limit publishes on each topic matching ``pattern`` (fnmatch syntax)
+        to ``rate`` messages per second, allowing bursts of ``burst``."""
+        if rate <= 0:
+            raise JoltException(f"Rate must be positive: {rate}")
+        if burst < 1:
+            raise JoltException(f"Burst must be at least 1: {burst}")
+        self._rate_limits.append((pattern, float(rate), int(burst)))
+        return self
+    
+    def topic_priority(self, pattern: str, priority: int):
+        """Send publishes on topics matching ``pattern`` (fnmatch syntax) with
+        ``priority``; lower values are written first."""
+        if priority <= PRIORITY_CONTROL:
+            raise JoltException(f"Priority {priority} is reserved for control frames")
+        self._topic_priorities.append((pattern, priority))
+        return self
+    
+    def scheduling(self, enabled: bool = True):
+        self._scheduling = enabled
+        return self
+    
+    def max_queue_size(self, size: int):
+        """Maximum number of frames waiting in the write queue; sends beyond
+        it raise ``JoltException``."""
+        if size < 1:
+            raise JoltException(f"Queue size must be at least 1: {size}")
+        self._max_queue_size = size
+        return self
+    
+    def topic_cache_size(self, size: int):
+        """Number of topics whose priority and rate limit lookups, and idle
+        token buckets, the write queue keeps around."""
+        if size < 1:
+            raise JoltException(f"Topic cache size must be at least 1: {size}")
+        self._topic_cache_size = size
+        return self
+    
     def build(self) -> JoltConfig:
-        return JoltConfig(self._host, self._port)
\ No newline at end of file
+        return JoltConfig(self._host, self._port, self._rate_limits,
+                          self._topic_priorities, self._scheduling,
+                          self._max_queue_size, self._topic_cache_size)
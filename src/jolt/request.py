@@ -1,4 +1,14 @@
 import json
+from functools import lru_cache
+
+TOPIC_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=TOPIC_CACHE_SIZE)
+def _publish_prefix(topic: str) -> str:
+    # Everything up to the payload, matching json.dumps' default separators.
+    return '{"op": "pub", "topic": ' + json.dumps(topic) + ', "data": '
+
 
 class JoltRequestBuilder:
     
@@ -29,12 +39,9 @@ class JoltRequestBuilder:
     
     @staticmethod
     def publish(topic: str, data: str) -> str:
-        request = {
-            "op": "pub",
-            "topic": topic,
-            "data": data
-        }
-        return json.dumps(request) + "\n"
+        if type(topic) is not str:
+            return json.dumps({"op": "pub", "topic": topic, "data": data}) + "\n"
+        return _publish_prefix(topic) + json.dumps(data) + "}\n"
         
     @staticmethod
     def ping() -> str:
@@ -1,6 +1,16 @@
 import json
+from functools import lru_cache
 from typing import Dict, Any
 from .exceptions import JoltException
+from .request import TOPIC_CACHE_SIZE
+
+
+@lru_cache(maxsize=TOPIC_CACHE_SIZE)
+def _shared_topic(topic: str) -> str:
+    # Returns the first equal string seen, so recent topics share one object
+    # without pinning every topic ever received the way sys.intern can.
+    return topic
+
 
 class JoltResponse:
     def __init__(self, raw_data: Dict[str, Any]):
@@ -42,7 +52,12 @@ class JoltErrorResponse(JoltResponse):
 class JoltTopicMessage(JoltResponse):
     def __init__(self, raw_data: Dict[str, Any]):
         super().__init__(raw_data)
-        self._topic = raw_data.get("topic", "")
+        topic = raw_data.get("topic", "")
+        if type(topic) is str:
+            # Share one topic object across messages and drop the fresh copy.
+            topic = _shared_topic(topic)
+            raw_data["topic"] = topic
+        self._topic = topic
         self._data = raw_data.get("data", "")
     
     def get_topic(self) -> str:
@@ -0,0 +1,266 @@
+import heapq
+import threading
+import time
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+from .config import JoltConfig, PRIORITY_CONTROL, PRIORITY_NORMAL
+from .exceptions import JoltException
+
+
+class JoltTokenBucket:
+
+    def __init__(self, rate: float, burst: int):
+        if rate <= 0:
+            raise JoltException(f"Rate must be positive: {rate}")
+        if burst < 1:
+            raise JoltException(f"Burst must be at least 1: {burst}")
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+
+    def reserve(self, now: Optional[float] = None) -> float:
+        """Take one token and return how long the caller must wait before
+        using it. Tokens may go negative so that queued reservations keep
+        their order."""
+        if now is None:
+            now = time.monotonic()
+        elapsed = max(0.0, now - self._last)
+        self._last = now
+        self._tokens = min(float(self._burst), self._tokens + elapsed * self._rate)
+        self._tokens -= 1.0
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self._rate
+
+    def is_full(self, now: Optional[float] = None) -> bool:
+        if now is None:
+            now = time.monotonic()
+        elapsed = max(0.0, now - self._last)
+        return self._tokens + elapsed * self._rate >= self._burst
+
+
+class JoltSendMetrics:
+
+    def __init__(self, sent_count: int = 0, throttled_count: int = 0,
+                 total_throttle_delay: float = 0.0, max_throttle_delay: float = 0.0,
+                 queue_depth: int = 0, rate_limited_topic_count: int = 0):
+        self._sent_count = sent_count
+        self._throttled_count = throttled_count
+        self._total_throttle_delay = total_throttle_delay
+        self._max_throttle_delay = max_throttle_delay
+        self._queue_depth = queue_depth
+        self._rate_limited_topic_count = rate_limited_topic_count
+
+    def get_sent_count(self) -> int:
+        return self._sent_count
+
+    def get_throttled_count(self) -> int:
+        return self._throttled_count
+
+    def get_total_throttle_delay(self) -> float:
+        return self._total_throttle_delay
+
+    def get_max_throttle_delay(self) -> float:
+        return self._max_throttle_delay
+
+    def get_average_throttle_delay(self) -> float:
+        if not self._throttled_count:
+            return 0.0
+        return self._total_throttle_delay / self._throttled_count
+
+    def get_queue_depth(self) -> int:
+        return self._queue_depth
+
+    def get_rate_limited_topic_count(self) -> int:
+        return self._rate_limited_topic_count
+
+    def __str__(self) -> str:
+        return (f"JoltSendMetrics(sent={self._sent_count}, throttled={self._throttled_count}, "
+                f"total_delay={self._total_throttle_delay:.3f}s, "
+                f"max_delay={self._max_throttle_delay:.3f}s, queued={self._queue_depth})")
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+
+class JoltSendScheduler:
+    """Priority write queue for a client connection.
+
+    Control frames (``topic`` of ``None``) are always written first, then
+    publishes in order of their topic priority. Publishes on rate limited
+    topics wait for a token without holding up other topics. At most
+    ``max_queue_size`` frames may be waiting; further submits raise
+    ``JoltException``, as do submits before ``start`` or after ``stop``.
+    """
+
+    def __init__(self, config: JoltConfig, writer: Callable[[str], None],
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        self._rate_limits = config.get_rate_limits()
+        self._topic_priorities = config.get_topic_priorities()
+        self._writer = writer
+        self._on_error = on_error
+        self._max_queue_size = config.get_max_queue_size()
+        self._topic_cache_size = config.get_topic_cache_size()
+        self._buckets: Dict[str, JoltTokenBucket] = {}
+        self._bucket_prune_at = self._topic_cache_size
+        self._priority_for = lru_cache(maxsize=self._topic_cache_size)(self._match_priority)
+        self._rate_limit_for = lru_cache(maxsize=self._topic_cache_size)(self._match_rate_limit)
+        self._ready: List[Tuple[int, int, str]] = []
+        self._delayed: List[Tuple[float, int, int, str]] = []
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._running = False
+        self._writing = False
+        self._thread: Optional[threading.Thread] = None
+        self._sent_count = 0
+        self._throttled_count = 0
+        self._total_throttle_delay = 0.0
+        self._max_throttle_delay = 0.0
+
+    def start(self):
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._write_loop, daemon=True)
+        self._thread.start()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every frame that is not waiting on a rate limit has
+        been written. Returns False if ``timeout`` expired first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._running and (self._writing or self._has_due_frames()):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def stop(self):
+        """Discard queued frames and signal the writer thread to exit. Use
+        ``flush`` first to deliver pending frames, and ``join`` to wait for
+        the thread, e.g. after closing a socket it may be blocked on."""
+        with self._cond:
+            self._running = False
+            self._ready.clear()
+            self._delayed.clear()
+            self._cond.notify_all()
+
+    def join(self, timeout: Optional[float] = None):
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+
+    def submit(self, payload: str, topic: Optional[str] = None, now: Optional[float] = None):
+        if now is None:
+            now = time.monotonic()
+        with self._cond:
+            if not self._running:
+                raise JoltException("Not connected")
+            if len(self._ready) + len(self._delayed) >= self._max_queue_size:
+                raise JoltException(f"Send queue full ({self._max_queue_size} frames)")
+
+            if topic is None:
+                priority = PRIORITY_CONTROL
+                delay = 0.0
+            else:
+                priority = self._priority_for(topic)
+                bucket = self._bucket_for(topic, now)
+                delay = bucket.reserve(now) if bucket else 0.0
+
+            seq = self._seq
+            self._seq += 1
+
+            if delay > 0:
+                self._throttled_count += 1
+                self._total_throttle_delay += delay
+                self._max_throttle_delay = max(self._max_throttle_delay, delay)
+                heapq.heappush(self._delayed, (now + delay, priority, seq, payload))
+            else:
+                heapq.heappush(self._ready, (priority, seq, payload))
+            self._cond.notify()
+
+    def get_metrics(self) -> JoltSendMetrics:
+        with self._cond:
+            return JoltSendMetrics(
+                self._sent_count,
+                self._throttled_count,
+                self._total_throttle_delay,
+                self._max_throttle_delay,
+                len(self._ready) + len(self._delayed),
+                len(self._buckets),
+            )
+
+    def _match_priority(self, topic: str) -> int:
+        for pattern, priority in self._topic_priorities:
+            if fnmatchcase(topic, pattern):
+                return priority
+        return PRIORITY_NORMAL
+
+    def _match_rate_limit(self, topic: str) -> Optional[Tuple[float, int]]:
+        for pattern, rate, burst in self._rate_limits:
+            if fnmatchcase(topic, pattern):
+                return rate, burst
+        return None
+
+    def _bucket_for(self, topic: str, now: float) -> Optional[JoltTokenBucket]:
+        bucket = self._buckets.get(topic)
+        if bucket is not None:
+            return bucket
+        limit = self._rate_limit_for(topic)
+        if limit is None:
+            return None
+        if len(self._buckets) >= self._bucket_prune_at:
+            self._prune_buckets(now)
+        bucket = JoltTokenBucket(*limit)
+        self._buckets[topic] = bucket
+        return bucket
+
+    def _prune_buckets(self, now: float):
+        # A refilled bucket behaves exactly like a new one, so it can go.
+        self._buckets = {t: b for t, b in self._buckets.items() if not b.is_full(now)}
+        self._bucket_prune_at = max(self._topic_cache_size, 2 * len(self._buckets))
+
+    def _has_due_frames(self) -> bool:
+        return bool(self._ready) or bool(self._delayed and self._delayed[0][0] <= time.monotonic())
+
+    def _next_payload(self) -> Optional[str]:
+        with self._cond:
+            self._writing = False
+            self._cond.notify_all()
+            while self._running:
+                now = time.monotonic()
+                while self._delayed and self._delayed[0][0] <= now:
+                    _, priority, seq, payload = heapq.heappop(self._delayed)
+                    heapq.heappush(self._ready, (priority, seq, payload))
+
+                if self._ready:
+                    self._writing = True
+                    return heapq.heappop(self._ready)[2]
+
+                timeout = self._delayed[0][0] - now if self._delayed else None
+                self._cond.wait(timeout)
+            return None
+
+    def _write_loop(self):
+        while True:
+            payload = self._next_payload()
+            if payload is None:
+                return
+            try:
+                self._writer(payload)
+            except Exception as e:
+                with self._cond:
+                    stopped = not self._running
+                    self._running = False
+                    self._writing = False
+                    self._ready.clear()
+                    self._delayed.clear()
+                    self._cond.notify_all()
+                if self._on_error and not stopped:
+                    self._on_error(e)
+                return
+            with self._cond:
+                self._sent_count += 1
@@ -0,0 +1,142 @@
+import socket
+import threading
+import time
+import pytest
+from typing import Optional
+from jolt import JoltClient, JoltConfig, JoltException, JoltMessageHandler, JoltRequestBuilder, PRIORITY_HIGH
+
+class RecordingHandler(JoltMessageHandler):
+    def __init__(self):
+        self.disconnects = []
+        self.disconnected = threading.Event()
+
+    def on_ok(self, raw_line: str):
+        pass
+
+    def on_error(self, error, raw_line: str):
+        pass
+
+    def on_topic_message(self, msg, raw_line: str):
+        pass
+
+    def on_disconnected(self, cause: Optional[Exception]):
+        self.disconnects.append(cause)
+        self.disconnected.set()
+
+class LocalBroker:
+    def __init__(self):
+        self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._server.bind(("127.0.0.1", 0))
+        self._server.listen(1)
+        self.port = self._server.getsockname()[1]
+        self.conn: Optional[socket.socket] = None
+        self.received = b""
+        self._accepted = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self):
+        self.conn, _ = self._server.accept()
+        self._accepted.set()
+        while True:
+            try:
+                chunk = self.conn.recv(4096)
+            except OSError:
+                break
+            if not chunk:
+                break
+            self.received += chunk
+
+    def wait_for_lines(self, count: int, timeout: float = 2.0):
+        deadline = time.monotonic() + timeout
+        while self.received.count(b"\n") < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self.received.decode("utf-8").splitlines(keepends=True)
+
+    def close(self):
+        self._accepted.wait(2.0)
+        if self.conn:
+            self.conn.close()
+        self._server.close()
+
+@pytest.fixture
+def broker():
+    server = LocalBroker()
+    yield server
+    server.close()
+
+def connect_client(broker, builder):
+    handler = RecordingHandler()
+    client = JoltClient(builder.port(broker.port).build(), handler)
+    client.connect()
+    return client, handler
+
+def test_scheduled_client_routes_publish_topics(broker):
+    client, handler = connect_client(broker, JoltConfig.new_builder()
+                                     .rate_limit("bulk", 1, burst=1)
+                                     .topic_priority("alerts", PRIORITY_HIGH))
+
+    client.publish("bulk", "1")
+    client.publish("bulk", "2")
+    client.publish("alerts", "fire")
+    client.ping()
+
+    lines = broker.wait_for_lines(3)
+    assert sorted(lines) == sorted([
+        JoltRequestBuilder.publish("bulk", "1"),
+        JoltRequestBuilder.publish("alerts", "fire"),
+        JoltRequestBuilder.ping(),
+    ])
+    assert client.get_send_metrics().get_throttled_count() == 1
+
+    client.close()
+    metrics = client.get_send_metrics()
+    assert metrics.get_sent_count() == 3
+    assert metrics.get_queue_depth() == 0
+    assert handler.disconnects == []
+
+def test_scheduled_client_close_delivers_queued_frames(broker):
+    client, handler = connect_client(broker, JoltConfig.new_builder().scheduling())
+
+    for i in range(200):
+        client.publish("t", str(i))
+    client.close()
+
+    lines = broker.wait_for_lines(200)
+    assert lines == [JoltRequestBuilder.publish("t", str(i)) for i in range(200)]
+    assert handler.disconnects == []
+
+def test_scheduled_client_rejects_sends_after_close(broker):
+    client, handler = connect_client(broker, JoltConfig.new_builder().scheduling())
+    client.close()
+
+    with pytest.raises(JoltException):
+        client.publish("t", "late")
+    assert handler.disconnects == []
+
+class FailingSocket(socket.socket):
+    fail_sends = False
+
+    def sendall(self, data, *args):
+        if FailingSocket.fail_sends:
+            raise BrokenPipeError("broken pipe")
+        return super().sendall(data, *args)
+
+def test_scheduled_client_reports_write_failure_once(broker, monkeypatch):
+    monkeypatch.setattr(socket, "socket", FailingSocket)
+    monkeypatch.setattr(FailingSocket, "fail_sends", False)
+    client, handler = connect_client(broker, JoltConfig.new_builder().scheduling())
+
+    FailingSocket.fail_sends = True
+    client.publish("topic", "data")
+
+    assert handler.disconnected.wait(2.0)
+    assert client.is_connected() is False
+    assert "Failed to send" in str(handler.disconnects[0])
+
+    # The reader sees the broker hang up next; it must not report again.
+    handler.disconnected.clear()
+    broker.close()
+    assert not handler.disconnected.wait(0.5)
+    assert len(handler.disconnects) == 1
+    client.close()
@@ -1,5 +1,5 @@
 import pytest
-from jolt import JoltConfig, JoltConfigBuilder
+from jolt import JoltConfig, JoltConfigBuilder, JoltException, PRIORITY_CONTROL, PRIORITY_HIGH
 
 def test_config_default_values():
     config = JoltConfig()
@@ -28,4 +28,42 @@ def test_config_builder_defaults():
 def test_config_string_representation():
     config = JoltConfig("test.host", 1234)
     assert "test.host" in str(config)
-    assert "1234" in str(config)
\ No newline at end of file
+    assert "1234" in str(config)
+
+def test_config_scheduling_disabled_by_default():
+    config = JoltConfig.new_builder().build()
+    assert config.is_scheduling_enabled() is False
+    assert config.get_rate_limits() == []
+    assert config.get_topic_priorities() == []
+
+def test_config_builder_rate_limits_and_priorities():
+    config = JoltConfig.new_builder() \
+        .rate_limit("bulk.*", 100, burst=10) \
+        .topic_priority("alerts.*", PRIORITY_HIGH) \
+        .build()
+    
+    assert config.get_rate_limits() == [("bulk.*", 100.0, 10)]
+    assert config.get_topic_priorities() == [("alerts.*", PRIORITY_HIGH)]
+    assert config.is_scheduling_enabled() is True
+
+def test_config_builder_max_queue_size():
+    assert JoltConfig.new_builder().build().get_max_queue_size() == 10000
+    config = JoltConfig.new_builder().max_queue_size(50).build()
+    assert config.get_max_queue_size() == 50
+    with pytest.raises(JoltException):
+        JoltConfig.new_builder().max_queue_size(0)
+
+def test_config_builder_topic_cache_size():
+    assert JoltConfig.new_builder().build().get_topic_cache_size() == 4096
+    config = JoltConfig.new_builder().topic_cache_size(64).build()
+    assert config.get_topic_cache_size() == 64
+    with pytest.raises(JoltException):
+        JoltConfig.new_builder().topic_cache_size(0)
+
+def test_config_builder_rejects_invalid_limits():
+    with pytest.raises(JoltException):
+        JoltConfig.new_builder().rate_limit("t", 0)
+    with pytest.raises(JoltException):
+        JoltConfig.new_builder().rate_limit("t", 10, burst=0)
+    with pytest.raises(JoltException):
+        JoltConfig.new_builder().topic_priority("t", PRIORITY_CONTROL)
@@ -77,4 +77,9 @@ def test_command_formats():
     assert pub_req["op"] == "pub"
     
     ping_req = json.loads(JoltRequestBuilder.ping())
-    assert ping_req["op"] == "ping"
\ No newline at end of file
+    assert ping_req["op"] == "ping"
+
+def test_publish_matches_full_encoding():
+    for topic, data in [("t", "d"), ("chat.\"quoted\"", "line\nbreak"), ("ünï", "çødé")]:
+        expected = json.dumps({"op": "pub", "topic": topic, "data": data}) + "\n"
+        assert JoltRequestBuilder.publish(topic, data) == expected
\ No newline at end of file
@@ -2,6 +2,7 @@ import pytest
 from jolt import JoltResponseParser
 from jolt.response import JoltOkResponse, JoltErrorResponse, JoltTopicMessage
 from jolt.exceptions import JoltException
+from jolt.request import TOPIC_CACHE_SIZE
 
 def test_parse_valid_json():
     data = JoltResponseParser.parse('{"ok": true}')
@@ -48,4 +49,18 @@ def test_ok_response():
 def test_response_raw_data():
     raw = {"topic": "test", "data": "message"}
     response = JoltTopicMessage(raw)
-    assert response.get_raw() == raw
\ No newline at end of file
+    assert response.get_raw() == raw
+
+def test_topic_messages_share_topic_string():
+    first = JoltResponseParser.parse_response('{"topic": "shared.topic", "data": "1"}')
+    second = JoltResponseParser.parse_response('{"topic": "shared.topic", "data": "2"}')
+    assert first.get_topic() is second.get_topic()
+    assert first.get_raw()["topic"] is first.get_topic()
+
+def test_topic_sharing_is_bounded():
+    first = JoltResponseParser.parse_response('{"topic": "evicted.topic", "data": "1"}')
+    for i in range(TOPIC_CACHE_SIZE):
+        JoltResponseParser.parse_response(f'{{"topic": "filler.{i}", "data": "x"}}')
+    again = JoltResponseParser.parse_response('{"topic": "evicted.topic", "data": "2"}')
+    assert again.get_topic() == first.get_topic()
+    assert again.get_topic() is not first.get_topic()
@@ -0,0 +1,219 @@
+import threading
+import time
+import pytest
+from jolt import JoltConfig, JoltSendScheduler, JoltTokenBucket, JoltRequestBuilder, PRIORITY_HIGH, PRIORITY_LOW
+from jolt.exceptions import JoltException
+
+class RecordingWriter:
+    """Records frames; while held, the first write blocks so later submits
+    queue up behind it."""
+    
+    def __init__(self, expected: int, hold: bool = False):
+        self.sent = []
+        self._expected = expected
+        self.done = threading.Event()
+        self.blocked = threading.Event()
+        self._released = threading.Event()
+        if not hold:
+            self._released.set()
+    
+    def release(self):
+        self._released.set()
+    
+    def __call__(self, payload: str):
+        self.blocked.set()
+        self._released.wait(5.0)
+        self.sent.append(payload)
+        if len(self.sent) >= self._expected:
+            self.done.set()
+
+def start_held(scheduler, writer):
+    scheduler.start()
+    scheduler.submit("first\n")
+    assert writer.blocked.wait(2.0)
+
+def test_token_bucket_allows_burst():
+    bucket = JoltTokenBucket(rate=10, burst=3)
+    now = time.monotonic()
+    assert [bucket.reserve(now) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert bucket.reserve(now) == pytest.approx(0.1)
+    assert bucket.reserve(now) == pytest.approx(0.2)
+
+def test_token_bucket_refills():
+    bucket = JoltTokenBucket(rate=10, burst=1)
+    now = time.monotonic()
+    assert bucket.reserve(now) == 0.0
+    assert bucket.reserve(now + 0.1) == pytest.approx(0.0)
+
+def test_token_bucket_rejects_invalid_rate():
+    with pytest.raises(JoltException):
+        JoltTokenBucket(rate=0, burst=1)
+
+def test_control_frames_jump_ahead_of_publishes():
+    config = JoltConfig.new_builder().scheduling().build()
+    writer = RecordingWriter(expected=5, hold=True)
+    scheduler = JoltSendScheduler(config, writer)
+    start_held(scheduler, writer)
+    
+    scheduler.submit(JoltRequestBuilder.publish("bulk", "1"), "bulk")
+    scheduler.submit(JoltRequestBuilder.publish("bulk", "2"), "bulk")
+    scheduler.submit(JoltRequestBuilder.subscribe("alerts"))
+    scheduler.submit(JoltRequestBuilder.ping())
+    writer.release()
+    
+    assert writer.done.wait(2.0)
+    scheduler.stop()
+    scheduler.join()
+    assert writer.sent[1:] == [
+        JoltRequestBuilder.subscribe("alerts"),
+        JoltRequestBuilder.ping(),
+        JoltRequestBuilder.publish("bulk", "1"),
+        JoltRequestBuilder.publish("bulk", "2"),
+    ]
+
+def test_topic_priorities_order_publishes():
+    config = JoltConfig.new_builder() \
+        .topic_priority("alerts.*", PRIORITY_HIGH) \
+        .topic_priority("logs.*", PRIORITY_LOW) \
+        .build()
+    writer = RecordingWriter(expected=4, hold=True)
+    scheduler = JoltSendScheduler(config, writer)
+    start_held(scheduler, writer)
+    
+    scheduler.submit("logs\n", "logs.app")
+    scheduler.submit("data\n", "data.x")
+    scheduler.submit("alert\n", "alerts.cpu")
+    writer.release()
+    
+    assert writer.done.wait(2.0)
+    scheduler.stop()
+    scheduler.join()
+    assert writer.sent[1:] == ["alert\n", "data\n", "logs\n"]
+
+def test_rate_limited_topic_does_not_block_others():
+    config = JoltConfig.new_builder().rate_limit("hot", 1, burst=1).build()
+    writer = RecordingWriter(expected=2)
+    scheduler = JoltSendScheduler(config, writer)
+    scheduler.start()
+    
+    scheduler.submit("hot1\n", "hot")
+    scheduler.submit("hot2\n", "hot")
+    scheduler.submit("cold\n", "cold")
+    
+    assert writer.done.wait(2.0)
+    assert scheduler.flush(timeout=2.0)
+    assert sorted(writer.sent) == ["cold\n", "hot1\n"]
+    
+    metrics = scheduler.get_metrics()
+    assert metrics.get_sent_count() == 2
+    assert metrics.get_throttled_count() == 1
+    assert metrics.get_queue_depth() == 1
+    scheduler.stop()
+    scheduler.join()
+
+def test_throttled_frames_keep_topic_order():
+    config = JoltConfig.new_builder().rate_limit("hot", 10, burst=1).build()
+    writer = RecordingWriter(expected=3)
+    scheduler = JoltSendScheduler(config, writer)
+    scheduler.start()
+    
+    # Reservations made in the past are already due, so no waiting is needed.
+    past = time.monotonic() - 60.0
+    for i in range(3):
+        scheduler.submit(f"hot{i}\n", "hot", now=past)
+    
+    assert writer.done.wait(2.0)
+    scheduler.stop()
+    scheduler.join()
+    assert writer.sent == ["hot0\n", "hot1\n", "hot2\n"]
+    
+    metrics = scheduler.get_metrics()
+    assert metrics.get_throttled_count() == 2
+    assert metrics.get_max_throttle_delay() == pytest.approx(0.2)
+    assert metrics.get_total_throttle_delay() == pytest.approx(0.3)
+
+def test_write_failure_stops_scheduler():
+    errors = []
+    
+    def failing_writer(payload: str):
+        raise OSError("broken pipe")
+    
+    config = JoltConfig.new_builder().scheduling().build()
+    scheduler = JoltSendScheduler(config, failing_writer, errors.append)
+    scheduler.start()
+    scheduler.submit(JoltRequestBuilder.ping())
+    
+    scheduler.join(timeout=2.0)
+    
+    assert len(errors) == 1
+    assert isinstance(errors[0], OSError)
+    with pytest.raises(JoltException):
+        scheduler.submit(JoltRequestBuilder.ping())
+
+def test_submit_requires_running_scheduler():
+    scheduler = JoltSendScheduler(JoltConfig.new_builder().scheduling().build(), RecordingWriter(expected=1))
+    with pytest.raises(JoltException):
+        scheduler.submit(JoltRequestBuilder.ping())
+
+def test_flush_waits_for_ready_frames():
+    writer = RecordingWriter(expected=4, hold=True)
+    scheduler = JoltSendScheduler(JoltConfig.new_builder().scheduling().build(), writer)
+    start_held(scheduler, writer)
+    for i in range(3):
+        scheduler.submit(f"{i}\n", "t")
+    
+    assert scheduler.flush(timeout=0.01) is False
+    writer.release()
+    assert scheduler.flush(timeout=2.0) is True
+    assert writer.sent == ["first\n", "0\n", "1\n", "2\n"]
+    scheduler.stop()
+    scheduler.join()
+
+def test_submit_raises_when_queue_full():
+    config = JoltConfig.new_builder().rate_limit("hot", 1, burst=1).max_queue_size(2).build()
+    writer = RecordingWriter(expected=1, hold=True)
+    scheduler = JoltSendScheduler(config, writer)
+    start_held(scheduler, writer)
+    
+    now = time.monotonic()
+    scheduler.submit("hot1\n", "hot", now=now)
+    scheduler.submit("hot2\n", "hot", now=now)
+    with pytest.raises(JoltException):
+        scheduler.submit("hot3\n", "hot", now=now)
+    
+    metrics = scheduler.get_metrics()
+    assert metrics.get_queue_depth() == 2
+    assert metrics.get_throttled_count() == 1
+    assert metrics.get_max_throttle_delay() == pytest.approx(1.0)
+    writer.release()
+    scheduler.stop()
+    scheduler.join()
+
+def test_unmatched_topics_get_no_bucket():
+    config = JoltConfig.new_builder().rate_limit("hot.*", 10, burst=1).build()
+    scheduler = JoltSendScheduler(config, RecordingWriter(expected=1))
+    scheduler.start()
+    
+    for i in range(100):
+        scheduler.submit("cold\n", f"cold.{i}")
+    scheduler.submit("hot\n", "hot.a")
+    
+    assert scheduler.get_metrics().get_rate_limited_topic_count() == 1
+    scheduler.stop()
+    scheduler.join()
+
+def test_refilled_buckets_are_pruned():
+    config = JoltConfig.new_builder().rate_limit("*", 10, burst=1).topic_cache_size(10).build()
+    scheduler = JoltSendScheduler(config, RecordingWriter(expected=1))
+    scheduler.start()
+    
+    now = time.monotonic()
+    for i in range(10):
+        scheduler.submit("x\n", f"topic.{i}", now=now)
+    assert scheduler.get_metrics().get_rate_limited_topic_count() == 10
+    
+    # A second later every bucket has refilled and can be dropped.
+    scheduler.submit("x\n", "topic.new", now=now + 1.0)
+    assert scheduler.get_metrics().get_rate_limited_topic_count() == 1
+    scheduler.stop()
+    scheduler.join()